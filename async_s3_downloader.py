@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Async S3 File Downloader
+
+AsyncIO variant of S3Downloader built on aioboto3. All S3 calls are
+non-blocking, so a directory download keeps many requests in flight on a
+single thread, bounded by a semaphore.
+
+Requires the optional dependencies:
+    pip install aioboto3 aiofiles
+"""
+
+import os
+import sys
+import asyncio
+import argparse
+from contextlib import AsyncExitStack
+from pathlib import Path
+from typing import List, Optional, Dict, Any
+
+import aioboto3
+import aiofiles
+from aiobotocore.config import AioConfig
+from botocore.exceptions import ClientError
+
+from s3_downloader import S3Object, logger, normalize_prefix
+
+# Default number of S3 requests kept in flight by download_directory
+DEFAULT_MAX_CONCURRENCY = 64
+
+
+class AsyncS3Downloader:
+    """AsyncIO counterpart of S3Downloader; use as an async context manager."""
+
+    def __init__(self,
+                 aws_access_key_id: Optional[str] = None,
+                 aws_secret_access_key: Optional[str] = None,
+                 region_name: Optional[str] = None,
+                 bucket_name: str = None,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        """
+        Initialize the aioboto3 session and downloader.
+
+        Args:
+            aws_access_key_id: AWS access key ID
+            aws_secret_access_key: AWS secret access key
+            region_name: AWS region name
+            bucket_name: S3 bucket name
+            max_concurrency: Maximum number of concurrent downloads
+        """
+        self.bucket_name = bucket_name
+        self.max_concurrency = max(1, max_concurrency)
+        self.download_path = Path.cwd() / "downloads"
+        self.download_path.mkdir(exist_ok=True)
+
+        self.session = aioboto3.Session(
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            region_name=region_name
+        )
+        self.s3_client = None
+        self._exit_stack = None
+
+    async def __aenter__(self) -> "AsyncS3Downloader":
+        # Size the aiohttp pool to the semaphore so requests are never queued behind it
+        config = AioConfig(max_pool_connections=self.max_concurrency)
+        self._exit_stack = AsyncExitStack()
+        self.s3_client = await self._exit_stack.enter_async_context(
+            self.session.client('s3', config=config)
+        )
+        logger.info("Async S3 client initialized successfully")
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._exit_stack.aclose()
+        self.s3_client = None
+        self._exit_stack = None
+
+    async def list_objects(self,
+                           bucket_name: Optional[str] = None,
+                           prefix: str = "",
+                           max_keys: Optional[int] = 1000) -> List[S3Object]:
+        """
+        List objects in a bucket with optional prefix filtering.
+
+        Args:
+            bucket_name: S3 bucket name (uses instance bucket if None)
+            prefix: Object key prefix to filter by
+            max_keys: Maximum number of keys to return (None for all)
+
+        Returns:
+            List of S3Object tuples (key, size, last_modified, etag)
+        """
+        bucket = bucket_name or self.bucket_name
+        if not bucket:
+            logger.error("No bucket name specified")
+            return []
+
+        try:
+            paginator = self.s3_client.get_paginator('list_objects_v2')
+            page_iterator = paginator.paginate(
+                Bucket=bucket,
+                Prefix=prefix,
+                PaginationConfig={'MaxItems': max_keys}
+            )
+
+            objects = []
+            async for page in page_iterator:
+                for obj in page.get('Contents', ()):
+                    objects.append(S3Object(
+                        obj['Key'],
+                        obj['Size'],
+                        obj['LastModified'],
+                        obj['ETag']
+                    ))
+
+            logger.info(f"Found {len(objects)} objects in bucket '{bucket}'")
+            return objects
+
+        except ClientError as e:
+            logger.error(f"Failed to list objects in bucket '{bucket}': {e}")
+            return []
+
+    async def download_file(self,
+                            object_key: str,
+                            local_path: Optional[str] = None,
+                            bucket_name: Optional[str] = None) -> bool:
+        """
+        Download a single file from S3.
+
+        Args:
+            object_key: S3 object key
+            local_path: Local file path (auto-generated if None)
+            bucket_name: S3 bucket name (uses instance bucket if None)
+
+        Returns:
+            True if download successful, False otherwise
+        """
+        bucket = bucket_name or self.bucket_name
+        if not bucket:
+            logger.error("No bucket name specified")
+            return False
+
+        # Determine local file path
+        if local_path:
+            local_file = Path(local_path)
+        else:
+            local_file = self.download_path / Path(object_key).name
+
+        # Create directory if it doesn't exist
+        local_file.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            logger.debug(f"Downloading {object_key} to {local_file}")
+
+            # Stream into a '.part' file so a failed transfer never leaves a
+            # truncated file behind or clobbers an existing copy
+            part_file = local_file.with_name(local_file.name + '.part')
+            try:
+                async with aiofiles.open(part_file, 'wb') as f:
+                    await self.s3_client.download_fileobj(bucket, object_key, f)
+                os.replace(part_file, local_file)
+            except BaseException:
+                if part_file.exists():
+                    part_file.unlink()
+                raise
+
+            logger.debug(f"Successfully downloaded {object_key}")
+            return True
+
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            if error_code in ('NoSuchKey', '404'):
+                logger.error(f"Object '{object_key}' not found in bucket '{bucket}'")
+            elif error_code == 'NoSuchBucket':
+                logger.error(f"Bucket '{bucket}' not found")
+            else:
+                logger.error(f"Failed to download {object_key}: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Unexpected error downloading {object_key}: {e}")
+            return False
+
+    async def download_directory(self,
+                                 prefix: str = "",
+                                 extensions: Optional[List[str]] = None,
+                                 bucket_name: Optional[str] = None,
+                                 max_files: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Download all files in a directory (prefix) from S3 concurrently.
+
+        Args:
+            prefix: S3 object key prefix (directory)
+            extensions: List of file extensions to filter by
+            bucket_name: S3 bucket name (uses instance bucket if None)
+            max_files: Maximum number of files to download
+
+        Returns:
+            Dictionary with download statistics (same shape as S3Downloader)
+        """
+        bucket = bucket_name or self.bucket_name
+        if not bucket:
+            logger.error("No bucket name specified")
+            return {'success': False, 'downloaded': 0, 'failed': 0, 'errors': []}
+
+        prefix = normalize_prefix(prefix)
+        objects = await self.list_objects(bucket, prefix, max_keys=None)
+        if not objects:
+            logger.warning(f"No objects found with prefix '{prefix}' in bucket '{bucket}'")
+            return {'success': True, 'downloaded': 0, 'failed': 0, 'errors': []}
+
+        # Filter by extensions if specified
+        if extensions:
+            # str.endswith accepts a tuple, so each key is lowercased and tested once
+            suffixes = tuple(ext.lower() for ext in extensions)
+            objects = [obj for obj in objects if obj.key.lower().endswith(suffixes)]
+            logger.info(f"Filtered to {len(objects)} objects with extensions: {extensions}")
+
+        # Limit number of files if specified
+        if max_files and len(objects) > max_files:
+            objects = objects[:max_files]
+            logger.info(f"Limited to {max_files} files")
+
+        # Skip directory markers and preserve directory structure locally
+        keys = [obj.key for obj in objects if not obj.key.endswith('/')]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _download_one(object_key: str) -> bool:
+            async with semaphore:
+                relative_path = object_key[len(prefix):].lstrip('/')
+                return await self.download_file(
+                    object_key, str(self.download_path / relative_path), bucket
+                )
+
+        logger.info(f"Starting download of {len(keys)} files from '{prefix}' "
+                    f"with concurrency {self.max_concurrency}")
+
+        results = await asyncio.gather(
+            *(_download_one(key) for key in keys),
+            return_exceptions=True
+        )
+
+        errors = [key for key, ok in zip(keys, results) if ok is not True]
+        downloaded = len(keys) - len(errors)
+        failed = len(errors)
+
+        stats = {
+            'success': failed == 0,
+            'downloaded': downloaded,
+            'failed': failed,
+            'errors': errors,
+            'total_files': len(objects)
+        }
+
+        logger.info(f"Download complete: {downloaded} successful, {failed} failed")
+        return stats
+
+
+async def _run(args: argparse.Namespace) -> None:
+    async with AsyncS3Downloader(
+        aws_access_key_id=args.access_key,
+        aws_secret_access_key=args.secret_key,
+        region_name=args.region,
+        bucket_name=args.bucket,
+        max_concurrency=args.max_concurrency
+    ) as downloader:
+        if args.output_dir:
+            downloader.download_path = Path(args.output_dir)
+            downloader.download_path.mkdir(parents=True, exist_ok=True)
+
+        stats = await downloader.download_directory(
+            args.download_dir,
+            args.extensions,
+            args.bucket,
+            args.max_files
+        )
+        print(f"Downloaded: {stats['downloaded']}, failed: {stats['failed']}")
+        for key in stats['errors']:
+            print(f"  - {key}")
+
+
+def main():
+    """Command line interface for async directory downloads."""
+    parser = argparse.ArgumentParser(description="Download an S3 directory using asyncio")
+    parser.add_argument('--access-key', help='AWS Access Key ID')
+    parser.add_argument('--secret-key', help='AWS Secret Access Key')
+    parser.add_argument('--region', default='us-east-1', help='AWS region (default: us-east-1)')
+    parser.add_argument('--bucket', required=True, help='S3 bucket name')
+    parser.add_argument('--download-dir', required=True, help='Download all files in a directory')
+    parser.add_argument('--extensions', nargs='+', help='File extensions to filter by')
+    parser.add_argument('--max-files', type=int, help='Maximum number of files to download')
+    parser.add_argument('--max-concurrency', type=int, default=DEFAULT_MAX_CONCURRENCY,
+                        help=f'Concurrent downloads (default: {DEFAULT_MAX_CONCURRENCY})')
+    parser.add_argument('--output-dir', help='Download directory (default: ./downloads)')
+
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(_run(args))
+    except KeyboardInterrupt:
+        logger.info("Download interrupted by user")
+    except Exception as e:
+        logger.error(f"Unexpected error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -29,15 +29,16 @@ def main():
     
     # Example 3: List objects in a bucket
     print("\n=== Example 3: List objects in bucket ===")
-    objects = downloader.list_objects(prefix='images/')  # List objects in images/ directory
+    # List objects in images/ directory; only key and size are needed here
+    objects = downloader.list_objects(prefix='images/', fields=())
     for obj in objects[:5]:  # Show first 5 objects
-        size_mb = obj['size'] / (1024 * 1024)
-        print(f"  - {obj['key']} ({size_mb:.2f} MB)")
+        size_mb = obj.size / (1024 * 1024)
+        print(f"  - {obj.key} ({size_mb:.2f} MB)")
     
     # Example 4: Download a single file
     print("\n=== Example 4: Download single file ===")
     if objects:
-        first_file = objects[0]['key']
+        first_file = objects[0].key
         success = downloader.download_file(first_file)
         if success:
             print(f"✅ Successfully downloaded {first_file}")
@@ -60,7 +61,7 @@ def main():
     # Example 6: Get file information
     print("\n=== Example 6: Get file information ===")
     if objects:
-        file_info = downloader.get_file_info(objects[0]['key'])
+        file_info = downloader.get_file_info(objects[0].key)
         if file_info:
             print(f"File: {file_info['key']}")
             print(f"Size: {file_info['size']} bytes")
@@ -74,16 +75,15 @@ def main():
     
     # Example 8: Custom download path
     print("\n=== Example 8: Custom download path ===")
-    custom_downloader = S3Downloader(
-        region_name='us-east-1',
-        bucket_name='your-s3-bucket-name'
+    # Reuses the existing downloader's S3 client instead of creating a new one
+    custom_downloader = downloader.with_download_path(
+        os.path.join(os.getcwd(), 'custom_downloads')
     )
-    custom_downloader.download_path = os.path.join(os.getcwd(), 'custom_downloads')
     
     # Download a file to custom location
     if objects:
         success = custom_downloader.download_file(
-            objects[0]['key'],
+            objects[0].key,
             os.path.join(custom_downloader.download_path, 'custom_name.jpg')
         )
         if success:
@@ -114,17 +114,18 @@ def example_error_handling():
     """Example of error handling."""
     print("\n=== Example error handling ===")
     
+    # One downloader serves both buckets; bucket_name can be overridden per call
+    downloader = S3Downloader(bucket_name='your-bucket-name')
+    
     try:
         # Try to access non-existent bucket
-        downloader = S3Downloader(bucket_name='non-existent-bucket')
-        objects = downloader.list_objects()
+        objects = downloader.list_objects(bucket_name='non-existent-bucket')
         print(f"Found {len(objects)} objects")
     except Exception as e:
         print(f"Expected error: {e}")
     
     try:
         # Try to download non-existent file
-        downloader = S3Downloader(bucket_name='your-bucket-name')
         success = downloader.download_file('non-existent-file.jpg')
         if not success:
             print("Expected failure for non-existent file")
@@ -140,6 +141,7 @@ if __name__ == "__main__":
         print("⚠️  AWS credentials not found in environment variables")
         print("Please set AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY")
         print("Or run 'aws configure' to set up AWS CLI")
+        print("Off EC2, set AWS_EC2_METADATA_DISABLED=true to skip the slow instance-metadata lookup")
         print("\nContinuing with examples (they will fail without credentials)...")
     
     main()
@@ -16,27 +16,225 @@ Features:
 
 import os
 import sys
+import base64
+import io
+import copy
+import hashlib
 import argparse
+import atexit
 import logging
+import logging.handlers
+import queue
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, NamedTuple, Optional, Dict, Any, Sequence, Tuple
 import boto3
-from botocore.exceptions import ClientError, NoCredentialsError, PartialCredentialsError
+from botocore.config import Config
+from botocore.exceptions import (
+    BotoCoreError, ClientError, FlexibleChecksumError, NoCredentialsError,
+    PartialCredentialsError
+)
+from s3transfer.exceptions import RetriesExceededError
+from s3transfer.manager import TransferManager, TransferConfig
+from s3transfer.subscribers import BaseSubscriber
+from s3transfer.utils import S3_RETRYABLE_DOWNLOAD_ERRORS
 from tqdm import tqdm
+
+try:
+    from uring_writer import IoUringWriter
+except ImportError:  # liburing is optional
+    IoUringWriter = None
+
+try:
+    # Hardware-accelerated CRC32C (SSE4.2 / ARMv8 CRC), installed by botocore[crt]
+    from awscrt.checksums import crc32c
+except ImportError:
+    crc32c = None
 import json
 from datetime import datetime
 
-# Configure logging
+# Configure logging; records go through a queue to a listener thread so
+# download workers never block on the file or console handlers
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler('s3_downloader.log'),
+    logging.StreamHandler(sys.stdout),
+    respect_handler_level=True
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('s3_downloader.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# Default number of concurrent per-file downloads in download_directory
+DEFAULT_MAX_WORKERS = 16
+
+# Objects larger than this are fetched as parallel byte-range GETs
+MB = 1024 * 1024
+RANGED_DOWNLOAD_THRESHOLD = 8 * MB
+RANGED_CHUNK_SIZE = 8 * MB
+RANGED_MAX_WORKERS = 16
+
+# Write buffer for single-stream downloads (smaller objects get a smaller one)
+DOWNLOAD_BUFFER_SIZE = 8 * MB
+
+# Bytes read per call when streaming a GetObject body (s3transfer's io_chunksize)
+STREAM_READ_SIZE = 256 * 1024
+
+# Attempts per GET when the body read fails mid-stream (s3transfer's default)
+DOWNLOAD_ATTEMPTS = 5
+
+# Number of threads queuing work onto the TransferManager in download_directory
+TRANSFER_SUBMISSION_CONCURRENCY = 8
+
+# Minimum seconds between progress bar refreshes
+PROGRESS_MIN_INTERVAL = 0.5
+
+# Floor for the botocore connection pool (botocore's own default is 10)
+MIN_POOL_CONNECTIONS = 50
+
+
+# Shared boto3 session so every S3Downloader reuses one credential chain lookup
+_SESSION: Optional[boto3.session.Session] = None
+
+# Bucket name -> region, so repeated S3Downloader instances look each bucket up once
+_BUCKET_REGIONS: Dict[str, str] = {}
+
+# Set once the missing-awscrt warning has been logged
+_CRC32C_WARNED = False
+
+
+def _get_session() -> boto3.session.Session:
+    """Return the module-wide boto3 session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = boto3.session.Session()
+    return _SESSION
+
+
+def normalize_prefix(prefix: str) -> str:
+    """
+    Add a trailing slash to prefixes that clearly name a directory.
+    
+    A non-empty prefix whose last path segment has no file extension is
+    treated as a directory, so 'images' lists 'images/...' rather than
+    every key starting with 'images' (e.g. 'images-old/...').
+    """
+    if prefix and not prefix.endswith('/') and '.' not in os.path.basename(prefix):
+        logger.debug(f"Treating prefix '{prefix}' as directory '{prefix}/'")
+        return prefix + '/'
+    return prefix
+
+
+# Optional S3Object fields that listings populate unless told otherwise
+OBJECT_FIELDS = ('last_modified', 'etag')
+
+
+class S3Object(NamedTuple):
+    """A listed S3 object; optional fields are None when not requested."""
+    key: str
+    size: int
+    last_modified: Optional[datetime] = None
+    etag: Optional[str] = None
+
+
+def _preallocate(fd: int, size: int) -> None:
+    """
+    Reserve size bytes for fd so concurrent range writers fill existing blocks.
+    
+    Uses posix_fallocate where available (Linux) and falls back to
+    ftruncate on platforms or filesystems that do not support it.
+    """
+    if hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(fd, 0, size)
+            return
+        except OSError:
+            pass
+    os.ftruncate(fd, size)
+
+
+def is_local_copy_current(local_file: Path, obj: S3Object) -> bool:
+    """
+    Check whether a local file already matches a listed S3 object.
+    
+    The file must have the object's size and either the object's
+    last-modified time (stamped by download_directory after each download)
+    or, for single-part uploads whose ETag is the content MD5, a matching
+    MD5. A file that matches by MD5 is re-stamped with the object's
+    timestamp so later checks take the cheap path. Multipart ETags cannot
+    be reproduced locally without the original part size, so those objects
+    only match on size and timestamp.
+    """
+    try:
+        stat = local_file.stat()
+    except OSError:
+        return False
+    if stat.st_size != obj.size:
+        return False
+    timestamp = obj.last_modified.timestamp()
+    if int(stat.st_mtime) == int(timestamp):
+        return True
+    
+    etag = obj.etag.strip('"')
+    if '-' in etag:
+        return False
+    md5 = hashlib.md5()
+    try:
+        with open(local_file, 'rb') as f:
+            for block in iter(lambda: f.read(RANGED_CHUNK_SIZE), b''):
+                md5.update(block)
+        if md5.hexdigest() != etag:
+            return False
+        os.utime(local_file, (timestamp, timestamp))
+    except OSError as e:
+        # An unreadable file is simply not current; the download then reports it
+        logger.debug(f"Could not check local copy {local_file}: {e}")
+        return False
+    return True
+
+
+class _DownloadSubscriber(BaseSubscriber):
+    """
+    Supplies listed object metadata to s3transfer and reports progress.
+    
+    When the transfer finishes, context + (future,) is put on done_queue,
+    so completions can be collected in whatever order they happen.
+    """
+    
+    def __init__(self,
+                 size: int,
+                 etag: Optional[str],
+                 progress_callback,
+                 done_queue: queue.SimpleQueue,
+                 context: Tuple = ()):
+        self._size = size
+        self._etag = etag
+        self._progress_callback = progress_callback
+        self._done_queue = done_queue
+        self._context = context
+    
+    def on_queued(self, future, **kwargs):
+        # A known size (and ETag, on newer s3transfer) lets s3transfer skip
+        # its own HEAD request
+        future.meta.provide_transfer_size(self._size)
+        if self._etag is not None and hasattr(future.meta, 'provide_object_etag'):
+            future.meta.provide_object_etag(self._etag)
+    
+    def on_progress(self, future, bytes_transferred, **kwargs):
+        self._progress_callback(bytes_transferred)
+    
+    def on_done(self, future, **kwargs):
+        self._done_queue.put(self._context + (future,))
+
 
 class S3Downloader:
     """Main class for handling S3 file downloads."""
@@ -45,28 +243,48 @@ class S3Downloader:
                  aws_access_key_id: Optional[str] = None,
                  aws_secret_access_key: Optional[str] = None,
                  region_name: Optional[str] = None,
-                 bucket_name: str = None):
+                 bucket_name: str = None,
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 use_uring: bool = False):
         """
         Initialize S3 client and downloader.
         
         Args:
             aws_access_key_id: AWS access key ID
             aws_secret_access_key: AWS secret access key
-            region_name: AWS region name
+            region_name: AWS region name; replaced by the bucket's own region
+                when bucket_name is given and the two differ
             bucket_name: S3 bucket name
+            max_workers: Number of files downloaded concurrently by download_directory.
+                The client's connection pool is sized to at least this many
+                connections so worker threads never wait on a free connection.
+            use_uring: Write large ranged downloads through io_uring (Linux,
+                requires the optional liburing package)
         """
         self.bucket_name = bucket_name
+        self.max_workers = max(1, max_workers)
+        self.quiet = False
+        self.verify_checksums = True
+        self.use_uring = use_uring and sys.platform == 'linux' and IoUringWriter is not None
+        if use_uring and not self.use_uring:
+            logger.warning("io_uring writes need Linux and the liburing package; using pwrite")
         self.download_path = Path.cwd() / "downloads"
         self.download_path.mkdir(exist_ok=True)
         
         # Initialize S3 client
         try:
-            self.s3_client = boto3.client(
-                's3',
-                aws_access_key_id=aws_access_key_id,
-                aws_secret_access_key=aws_secret_access_key,
-                region_name=region_name
+            self.s3_client = self._create_client(
+                aws_access_key_id, aws_secret_access_key, region_name
             )
+            
+            # Pin the client to the bucket's region; a mismatched region makes
+            # S3 redirect requests, each costing a reconnect to another endpoint
+            bucket_region = self._bucket_region(bucket_name) if bucket_name else None
+            if bucket_region and bucket_region != self.s3_client.meta.region_name:
+                logger.info(f"Bucket '{bucket_name}' is in {bucket_region}; using that region")
+                self.s3_client = self._create_client(
+                    aws_access_key_id, aws_secret_access_key, bucket_region
+                )
             logger.info("S3 client initialized successfully")
         except (NoCredentialsError, PartialCredentialsError) as e:
             logger.error(f"AWS credentials error: {e}")
@@ -76,6 +294,120 @@ class S3Downloader:
             logger.error(f"Failed to initialize S3 client: {e}")
             sys.exit(1)
     
+    def _create_client(self,
+                       aws_access_key_id: Optional[str],
+                       aws_secret_access_key: Optional[str],
+                       region_name: Optional[str]):
+        """Create an S3 client from the shared session."""
+        return _get_session().client(
+            's3',
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            region_name=region_name,
+            config=self._client_config()
+        )
+    
+    def _bucket_region(self, bucket: str) -> Optional[str]:
+        """Return the bucket's region, or None if it can't be determined."""
+        if bucket in _BUCKET_REGIONS:
+            return _BUCKET_REGIONS[bucket]
+        try:
+            location = self.s3_client.get_bucket_location(Bucket=bucket)['LocationConstraint']
+        except (ClientError, BotoCoreError) as e:
+            logger.debug(f"Could not determine region of bucket '{bucket}': {e}")
+            return None
+        # us-east-1 is reported as None and legacy eu-west-1 buckets as 'EU'
+        if not location:
+            location = 'us-east-1'
+        elif location == 'EU':
+            location = 'eu-west-1'
+        _BUCKET_REGIONS[bucket] = location
+        return location
+    
+    def _client_config(self) -> Config:
+        """Build the botocore client config sized for concurrent downloads."""
+        # max_pool_connections must be >= the number of threads sharing the
+        # client, otherwise urllib3 discards connections and requests serialize
+        return Config(
+            max_pool_connections=max(self.max_workers, RANGED_MAX_WORKERS, MIN_POOL_CONNECTIONS),
+            retries={'mode': 'adaptive', 'max_attempts': 5},
+            tcp_keepalive=True,
+            s3={'use_accelerate_endpoint': False, 'addressing_style': 'virtual'}
+        )
+    
+    def with_download_path(self, download_path) -> 'S3Downloader':
+        """
+        Return a copy of this downloader that saves files under download_path.
+        
+        The copy shares this instance's S3 client (and its connection pool),
+        so no new credentials lookup or TLS handshakes are needed.
+        
+        Args:
+            download_path: Directory for downloaded files
+            
+        Returns:
+            New S3Downloader sharing this instance's client
+        """
+        downloader = copy.copy(self)
+        downloader.download_path = Path(download_path)
+        downloader.download_path.mkdir(parents=True, exist_ok=True)
+        return downloader
+    
+    def _download_args(self) -> Optional[Dict[str, str]]:
+        """Extra GetObject arguments for downloads."""
+        # Ask S3 for the object's stored checksum (CRC32C, CRC32, ...) so
+        # botocore validates the body instead of relying on MD5 ETags
+        if self.verify_checksums:
+            return {'ChecksumMode': 'ENABLED'}
+        return None
+    
+    def _verify_crc32c(self,
+                       bucket: str,
+                       object_key: str,
+                       local_file: Path,
+                       head_response: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Check a ranged download against the object's full-object CRC32C.
+        
+        Ranged GETs carry no checksum, so the finished file is hashed and
+        compared with the value from a HEAD request. Skipped when awscrt is
+        not installed or the object only has a composite (per-part) checksum.
+        
+        Args:
+            head_response: HeadObject response fetched with ChecksumMode
+                enabled, if the caller already has one; saves a HEAD
+        
+        Raises:
+            FlexibleChecksumError: If the checksums differ
+        """
+        global _CRC32C_WARNED
+        if crc32c is None:
+            if not _CRC32C_WARNED:
+                _CRC32C_WARNED = True
+                logger.warning("awscrt is not installed; CRC32C verification of large "
+                               "downloads is disabled (pip install botocore[crt])")
+            return
+        response = head_response
+        if response is None:
+            response = self.s3_client.head_object(
+                Bucket=bucket,
+                Key=object_key,
+                ChecksumMode='ENABLED'
+            )
+        expected = response.get('ChecksumCRC32C')
+        if not expected or '-' in expected or response.get('ChecksumType') == 'COMPOSITE':
+            return
+        
+        crc = 0
+        with open(local_file, 'rb') as f:
+            for block in iter(lambda: f.read(RANGED_CHUNK_SIZE), b''):
+                crc = crc32c(block, crc)
+        actual = base64.b64encode(crc.to_bytes(4, 'big')).decode('ascii')
+        if actual != expected:
+            raise FlexibleChecksumError(
+                error_msg=f"Expected CRC32C {expected} for {object_key}, got {actual}"
+            )
+    
     def list_buckets(self) -> List[str]:
         """List all accessible S3 buckets."""
         try:
@@ -87,20 +419,79 @@ class S3Downloader:
             logger.error(f"Failed to list buckets: {e}")
             return []
     
+    def iter_objects(self,
+                     bucket_name: Optional[str] = None,
+                     prefix: str = "",
+                     max_keys: Optional[int] = None,
+                     recursive: bool = True,
+                     fields: Sequence[str] = OBJECT_FIELDS) -> Iterator[S3Object]:
+        """
+        Lazily list objects in a bucket, yielding each page as it arrives.
+        
+        Args:
+            bucket_name: S3 bucket name (uses instance bucket if None)
+            prefix: Object key prefix to filter by, matched verbatim
+            max_keys: Maximum number of keys to yield (None for all)
+            recursive: If False, only list direct children of the prefix
+            fields: Optional S3Object fields to populate (subset of OBJECT_FIELDS);
+                the rest are left as None to keep large listings small
+            
+        Yields:
+            S3Object for each listed object
+            
+        Raises:
+            ClientError: If a listing request fails
+            ValueError: If fields names an unknown field
+        """
+        unknown = set(fields) - set(OBJECT_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown object fields: {sorted(unknown)}")
+        with_modified = 'last_modified' in fields
+        with_etag = 'etag' in fields
+        
+        bucket = bucket_name or self.bucket_name
+        if not bucket:
+            logger.error("No bucket name specified")
+            return
+        
+        list_kwargs = {'Bucket': bucket, 'Prefix': prefix}
+        if not recursive:
+            # Let S3 roll deeper keys up into CommonPrefixes instead of returning them
+            list_kwargs['Delimiter'] = '/'
+        
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        page_iterator = paginator.paginate(
+            **list_kwargs,
+            PaginationConfig={'MaxItems': max_keys}
+        )
+        
+        for page in page_iterator:
+            for obj in page.get('Contents', ()):
+                yield S3Object(
+                    obj['Key'],
+                    obj['Size'],
+                    obj['LastModified'] if with_modified else None,
+                    obj['ETag'] if with_etag else None
+                )
+    
     def list_objects(self, 
                     bucket_name: Optional[str] = None,
                     prefix: str = "",
-                    max_keys: int = 1000) -> List[Dict[str, Any]]:
+                    max_keys: int = 1000,
+                    recursive: bool = True,
+                    fields: Sequence[str] = OBJECT_FIELDS) -> List[S3Object]:
         """
         List objects in a bucket with optional prefix filtering.
         
         Args:
             bucket_name: S3 bucket name (uses instance bucket if None)
-            prefix: Object key prefix to filter by
+            prefix: Object key prefix to filter by, matched verbatim
             max_keys: Maximum number of keys to return
+            recursive: If False, only list direct children of the prefix
+            fields: Optional S3Object fields to populate (subset of OBJECT_FIELDS)
             
         Returns:
-            List of object dictionaries with key, size, and last_modified
+            List of S3Object tuples (key, size, last_modified, etag)
         """
         bucket = bucket_name or self.bucket_name
         if not bucket:
@@ -108,24 +499,7 @@ class S3Downloader:
             return []
         
         try:
-            paginator = self.s3_client.get_paginator('list_objects_v2')
-            page_iterator = paginator.paginate(
-                Bucket=bucket,
-                Prefix=prefix,
-                PaginationConfig={'MaxItems': max_keys}
-            )
-            
-            objects = []
-            for page in page_iterator:
-                if 'Contents' in page:
-                    for obj in page['Contents']:
-                        objects.append({
-                            'key': obj['Key'],
-                            'size': obj['Size'],
-                            'last_modified': obj['LastModified'],
-                            'etag': obj['ETag']
-                        })
-            
+            objects = list(self.iter_objects(bucket, prefix, max_keys, recursive, fields))
             logger.info(f"Found {len(objects)} objects in bucket '{bucket}'")
             return objects
             
@@ -136,7 +510,9 @@ class S3Downloader:
     def download_file(self, 
                      object_key: str,
                      local_path: Optional[str] = None,
-                     bucket_name: Optional[str] = None) -> bool:
+                     bucket_name: Optional[str] = None,
+                     file_size: Optional[int] = None,
+                     etag: Optional[str] = None) -> bool:
         """
         Download a single file from S3.
         
@@ -144,6 +520,11 @@ class S3Downloader:
             object_key: S3 object key
             local_path: Local file path (auto-generated if None)
             bucket_name: S3 bucket name (uses instance bucket if None)
+            file_size: Object size in bytes if already known (e.g. from a listing);
+                the download then needs no HEAD request
+            etag: Object ETag if already known; large objects are fetched as
+                several range GETs, and each one is pinned to this version.
+                Taken from the HEAD response when file_size is looked up.
             
         Returns:
             True if download successful, False otherwise
@@ -163,22 +544,46 @@ class S3Downloader:
         local_file.parent.mkdir(parents=True, exist_ok=True)
         
         try:
-            # Get object metadata for progress tracking
-            response = self.s3_client.head_object(Bucket=bucket, Key=object_key)
-            file_size = response['ContentLength']
+            # The size picks single-stream vs ranged download and sizes the
+            # progress bar; only look it up when the caller didn't supply it.
+            # The same HEAD also returns the stored checksum for ranged downloads.
+            head_response = None
+            if file_size is None:
+                head_response = self.s3_client.head_object(
+                    Bucket=bucket,
+                    Key=object_key,
+                    **(self._download_args() or {})
+                )
+                file_size = head_response['ContentLength']
+                if etag is None:
+                    etag = head_response['ETag']
             
-            logger.info(f"Downloading {object_key} ({file_size} bytes) to {local_file}")
+            logger.debug(f"Downloading {object_key} ({file_size} bytes) to {local_file}")
             
-            # Download with progress bar
-            with tqdm(total=file_size, unit='B', unit_scale=True, desc=object_key) as pbar:
-                self.s3_client.download_file(
-                    bucket,
-                    object_key,
-                    str(local_file),
-                    Callback=lambda bytes_transferred: pbar.update(bytes_transferred)
-                )
+            use_ranged = file_size > RANGED_DOWNLOAD_THRESHOLD and hasattr(os, 'pwrite')
+            
+            # Download with progress bar; quiet mode skips tqdm and the callback
+            if self.quiet:
+                progress = nullcontext()
+            else:
+                progress = tqdm(total=file_size, unit='B', unit_scale=True, desc=object_key,
+                                mininterval=PROGRESS_MIN_INTERVAL)
+            with progress as pbar:
+                callback = pbar.update if pbar is not None else None
+                if use_ranged:
+                    self._download_ranged(
+                        bucket,
+                        object_key,
+                        local_file,
+                        file_size,
+                        callback,
+                        etag,
+                        head_response
+                    )
+                else:
+                    self._download_buffered(bucket, object_key, local_file, file_size, callback)
             
-            logger.info(f"Successfully downloaded {object_key}")
+            logger.debug(f"Successfully downloaded {object_key}")
             return True
             
         except ClientError as e:
@@ -194,11 +599,176 @@ class S3Downloader:
             logger.error(f"Unexpected error downloading {object_key}: {e}")
             return False
     
+    def _download_buffered(self,
+                           bucket: str,
+                           object_key: str,
+                           local_file: Path,
+                           file_size: int,
+                           callback) -> None:
+        """
+        Download an object as one streamed GET through a large-buffered file handle.
+        
+        A plain get_object is used rather than download_fileobj, which would
+        send its own HEAD for the size and ETag. Data is streamed into a
+        '.part' file that replaces local_file only once complete, so a failed
+        download never clobbers an existing copy.
+        """
+        # Don't allocate a full-size buffer for objects smaller than it
+        buffer_size = max(io.DEFAULT_BUFFER_SIZE, min(file_size, DOWNLOAD_BUFFER_SIZE))
+        
+        part_file = local_file.with_name(local_file.name + '.part')
+        try:
+            with open(part_file, 'wb', buffering=buffer_size) as f:
+                def write(position: int, chunk: bytes) -> None:
+                    # A retried GET starts again from the beginning
+                    if position != f.tell():
+                        f.seek(position)
+                    f.write(chunk)
+                
+                # botocore validates the body checksum as the last chunk is read
+                self._stream_object(
+                    write,
+                    callback,
+                    Bucket=bucket,
+                    Key=object_key,
+                    **(self._download_args() or {})
+                )
+            os.replace(part_file, local_file)
+        except BaseException:
+            if part_file.exists():
+                part_file.unlink()
+            raise
+    
+    def _stream_object(self, write, callback, **get_args) -> Dict[str, Any]:
+        """
+        GET an object (or a range of it) and pass its body to write in chunks.
+        
+        write is called as write(position, chunk), with position counted
+        from the start of the requested bytes. As in s3transfer's
+        GetObjectTask, a body read that fails mid-stream (ReadTimeout,
+        IncompleteRead, ...) re-sends the GET, pinned to the first response's
+        ETag, and rewinds the progress callback, up to DOWNLOAD_ATTEMPTS times.
+        
+        Returns:
+            The GetObject response
+            
+        Raises:
+            RetriesExceededError: If every attempt failed mid-stream
+        """
+        last_exception = None
+        for attempt in range(1, DOWNLOAD_ATTEMPTS + 1):
+            position = 0
+            try:
+                response = self.s3_client.get_object(**get_args)
+                # A retry must re-read the same version, not a newer upload
+                get_args.setdefault('IfMatch', response['ETag'])
+                for chunk in response['Body'].iter_chunks(STREAM_READ_SIZE):
+                    write(position, chunk)
+                    position += len(chunk)
+                    if callback is not None:
+                        callback(len(chunk))
+                return response
+            except S3_RETRYABLE_DOWNLOAD_ERRORS as e:
+                logger.debug(f"Retrying {get_args['Key']} after read error "
+                             f"(attempt {attempt}/{DOWNLOAD_ATTEMPTS}): {e}")
+                last_exception = e
+                if callback is not None and position:
+                    callback(-position)
+        raise RetriesExceededError(last_exception)
+    
+    def _download_ranged(self,
+                         bucket: str,
+                         object_key: str,
+                         local_file: Path,
+                         file_size: int,
+                         callback,
+                         etag: Optional[str] = None,
+                         head_response: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Download a large object as concurrent byte-range GETs.
+        
+        Each chunk is written at its own offset into a '.part' file
+        preallocated to file_size, so chunks may complete in any order. With
+        use_uring the writes are batched through an IoUringWriter instead of
+        os.pwrite. The '.part' file replaces local_file only once complete;
+        if any range fails it is removed and an existing copy is left intact.
+        With an etag, every range is sent with IfMatch (as s3transfer does),
+        so an object overwritten mid-download fails the download instead of
+        mixing chunks from two versions.
+        """
+        # Pin each range to the version we sized the file from
+        get_args = {'IfMatch': etag} if etag is not None else {}
+        
+        def fetch_range(offset: int) -> Optional[Future]:
+            end = min(offset + RANGED_CHUNK_SIZE, file_size) - 1
+            buffer = io.BytesIO()
+            
+            def write(position: int, chunk: bytes) -> None:
+                buffer.seek(position)
+                buffer.write(chunk)
+            
+            self._stream_object(
+                write,
+                callback,
+                Bucket=bucket,
+                Key=object_key,
+                Range=f'bytes={offset}-{end}',
+                **get_args
+            )
+            data = buffer.getvalue()
+            # Hand the write to the io_uring thread so this worker can start its next GET
+            if writer is not None:
+                return writer.submit(fd, data, offset)
+            os.pwrite(fd, data, offset)
+            return None
+        
+        part_file = local_file.with_name(local_file.name + '.part')
+        fd = os.open(part_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        writer = None
+        completed = False
+        try:
+            if self.use_uring:
+                # Ring setup fails where io_uring is blocked (e.g. Docker's
+                # default seccomp profile); fall back to pwrite from then on
+                try:
+                    writer = IoUringWriter()
+                except Exception as e:
+                    logger.warning(f"io_uring unavailable ({e}); using pwrite")
+                    self.use_uring = False
+            _preallocate(fd, file_size)
+            with ThreadPoolExecutor(max_workers=RANGED_MAX_WORKERS) as executor:
+                futures = [
+                    executor.submit(fetch_range, offset)
+                    for offset in range(0, file_size, RANGED_CHUNK_SIZE)
+                ]
+                try:
+                    write_futures = [future.result() for future in as_completed(futures)]
+                except BaseException:
+                    # One failed range fails the file; don't fetch the ones still queued
+                    for future in futures:
+                        future.cancel()
+                    raise
+            for write_future in write_futures:
+                if write_future is not None:
+                    write_future.result()
+            if self.verify_checksums:
+                self._verify_crc32c(bucket, object_key, part_file, head_response)
+            completed = True
+        finally:
+            # Drain queued io_uring writes before the fd goes away
+            if writer is not None:
+                writer.close()
+            os.close(fd)
+            if not completed:
+                part_file.unlink()
+        os.replace(part_file, local_file)
+    
     def download_directory(self,
                           prefix: str = "",
                           extensions: Optional[List[str]] = None,
                           bucket_name: Optional[str] = None,
-                          max_files: Optional[int] = None) -> Dict[str, Any]:
+                          max_files: Optional[int] = None,
+                          skip_existing: bool = True) -> Dict[str, Any]:
         """
         Download all files in a directory (prefix) from S3.
         
@@ -207,6 +777,8 @@ class S3Downloader:
             extensions: List of file extensions to filter by
             bucket_name: S3 bucket name (uses instance bucket if None)
             max_files: Maximum number of files to download
+            skip_existing: Skip objects whose local copy is already current
+                (see is_local_copy_current), making repeated runs a sync
             
         Returns:
             Dictionary with download statistics
@@ -214,62 +786,168 @@ class S3Downloader:
         bucket = bucket_name or self.bucket_name
         if not bucket:
             logger.error("No bucket name specified")
-            return {'success': False, 'downloaded': 0, 'failed': 0, 'errors': []}
+            return {'success': False, 'downloaded': 0, 'failed': 0, 'skipped': 0, 'errors': []}
         
-        # List objects in the directory
-        objects = self.list_objects(bucket, prefix)
-        if not objects:
-            logger.warning(f"No objects found with prefix '{prefix}' in bucket '{bucket}'")
-            return {'success': True, 'downloaded': 0, 'failed': 0, 'errors': []}
+        # The prefix names a directory, so 'images' must not pull in 'images-old/...'
+        prefix = normalize_prefix(prefix)
+        
+        # Stream the listing straight into the transfer queue so downloads
+        # start after the first page instead of after the full scan
+        objects = self.iter_objects(bucket, prefix)
         
         # Filter by extensions if specified
         if extensions:
-            objects = [
-                obj for obj in objects 
-                if any(obj['key'].lower().endswith(ext.lower()) for ext in extensions)
-            ]
-            logger.info(f"Filtered to {len(objects)} objects with extensions: {extensions}")
+            # str.endswith accepts a tuple, so each key is lowercased and tested once
+            suffixes = tuple(ext.lower() for ext in extensions)
+            objects = (obj for obj in objects if obj.key.lower().endswith(suffixes))
+            logger.info(f"Filtering to objects with extensions: {extensions}")
         
         # Limit number of files if specified
-        if max_files and len(objects) > max_files:
-            objects = objects[:max_files]
-            logger.info(f"Limited to {max_files} files")
+        if max_files:
+            objects = islice(objects, max_files)
+            logger.info(f"Limiting to {max_files} files")
         
-        # Download files
-        downloaded = 0
-        failed = 0
+        # Queue every download on a single TransferManager so all files share
+        # one bounded request pool on top of the client's connection pool.
+        # Its bounded submission queue also throttles the listing.
+        transfer_config = TransferConfig(
+            multipart_threshold=RANGED_DOWNLOAD_THRESHOLD,
+            multipart_chunksize=RANGED_CHUNK_SIZE,
+            max_request_concurrency=self.max_workers,
+            max_submission_concurrency=TRANSFER_SUBMISSION_CONCURRENCY
+        )
+        
+        # Outcomes are tallied only on this thread; transfer threads share no counters
+        total_files = 0
+        counts = Counter()
         errors = []
+        listing_failed = False
+        # Transfer threads push (key, path, size, mtime, future) here as each one ends
+        done = queue.SimpleQueue()
+        in_flight = 0
         
-        logger.info(f"Starting download of {len(objects)} files from '{prefix}'")
+        def record(results: Iterator[Tuple[bool, str]]) -> None:
+            for ok, object_key in results:
+                counts['downloaded' if ok else 'failed'] += 1
+                if not ok:
+                    errors.append(object_key)
         
-        for obj in objects:
-            object_key = obj['key']
-            
-            # Skip if it's a directory marker
-            if object_key.endswith('/'):
-                continue
-            
-            # Create local path preserving directory structure
-            relative_path = object_key[len(prefix):].lstrip('/')
-            local_file = self.download_path / relative_path
+        def finished(wait: bool) -> Iterator[Tuple[bool, str]]:
+            # Collect transfers in completion order: those already done, or all with wait
+            nonlocal in_flight
+            while in_flight and (wait or not done.empty()):
+                in_flight -= 1
+                yield self._finish_transfer(bucket, *done.get())
+        
+        logger.info(f"Starting download from '{prefix}' with {self.max_workers} workers")
+        
+        with tqdm(total=0, unit='B', unit_scale=True, desc=prefix or bucket,
+                  mininterval=PROGRESS_MIN_INTERVAL, disable=self.quiet) as pbar, \
+                TransferManager(self.s3_client, transfer_config) as manager:
+            created_dirs = set()
+            prefix_len = len(prefix)
+            base_path = self.download_path
+            try:
+                for obj in objects:
+                    total_files += 1
+                    object_key = obj.key
+                    
+                    # Skip if it's a directory marker
+                    if object_key.endswith('/'):
+                        continue
+                    
+                    # Create local path preserving directory structure;
+                    # s3transfer does not create parent directories
+                    relative_path = object_key[prefix_len:]
+                    if relative_path.startswith('/'):
+                        # Strip every leading slash so the path can't escape base_path
+                        relative_path = relative_path.lstrip('/')
+                    local_file = base_path / relative_path
+                    if skip_existing and is_local_copy_current(local_file, obj):
+                        counts['skipped'] += 1
+                        continue
+                    if local_file.parent not in created_dirs:
+                        local_file.parent.mkdir(parents=True, exist_ok=True)
+                        created_dirs.add(local_file.parent)
+                    
+                    pbar.total += obj.size
+                    manager.download(
+                        bucket,
+                        object_key,
+                        str(local_file),
+                        extra_args=self._download_args(),
+                        subscribers=[_DownloadSubscriber(
+                            obj.size,
+                            obj.etag,
+                            pbar.update,
+                            done,
+                            (object_key, local_file, obj.size, obj.last_modified)
+                        )]
+                    )
+                    in_flight += 1
+                    
+                    # Collect finished transfers as we go so memory stays bounded
+                    record(finished(wait=False))
+            except ClientError as e:
+                logger.error(f"Failed to list objects in bucket '{bucket}': {e}")
+                listing_failed = True
             
-            if self.download_file(object_key, str(local_file), bucket):
-                downloaded += 1
-            else:
-                failed += 1
-                errors.append(object_key)
+            record(finished(wait=True))
         
+        if total_files == 0 and not listing_failed:
+            logger.warning(f"No objects found with prefix '{prefix}' in bucket '{bucket}'")
+            return {'success': True, 'downloaded': 0, 'failed': 0, 'skipped': 0, 'errors': []}
+        
+        downloaded = counts['downloaded']
+        failed = counts['failed']
+        skipped = counts['skipped']
         stats = {
-            'success': failed == 0,
+            'success': failed == 0 and not listing_failed,
             'downloaded': downloaded,
             'failed': failed,
+            'skipped': skipped,
             'errors': errors,
-            'total_files': len(objects)
+            'total_files': total_files
         }
         
-        logger.info(f"Download complete: {downloaded} successful, {failed} failed")
+        logger.info(f"Download complete: {downloaded} successful, {failed} failed, "
+                    f"{skipped} unchanged")
         return stats
     
+    def _finish_transfer(self,
+                         bucket: str,
+                         object_key: str,
+                         local_file: Path,
+                         size: int,
+                         last_modified: datetime,
+                         future) -> Tuple[bool, str]:
+        """
+        Wait for a queued transfer and stamp the file with the object's timestamp.
+        
+        s3transfer fetches objects above RANGED_DOWNLOAD_THRESHOLD as ranged
+        GETs, which carry no checksum, so those files are checked against the
+        object's CRC32C here and removed if it doesn't match.
+        
+        Returns:
+            (succeeded, object_key) tuple
+        """
+        try:
+            future.result()
+            if self.verify_checksums and size > RANGED_DOWNLOAD_THRESHOLD:
+                try:
+                    self._verify_crc32c(bucket, object_key, local_file)
+                except FlexibleChecksumError:
+                    local_file.unlink()
+                    raise
+            # Stamp the object's timestamp so the next run can skip it cheaply
+            timestamp = last_modified.timestamp()
+            os.utime(local_file, (timestamp, timestamp))
+            logger.debug(f"Successfully downloaded {object_key}")
+            return True, object_key
+        except Exception as e:
+            logger.error(f"Failed to download {object_key}: {e}")
+            return False, object_key
+    
     def get_file_info(self, 
                      object_key: str,
                      bucket_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
@@ -305,7 +983,84 @@ class S3Downloader:
         except ClientError as e:
             logger.error(f"Failed to get info for {object_key}: {e}")
             return None
-    
+
+    def get_files_info(self,
+                       object_keys: List[str],
+                       bucket_name: Optional[str] = None,
+                       include_metadata: bool = False) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get information about many S3 objects using a few listings.
+
+        Keys are grouped by directory, and size, ETag and last-modified time
+        come from one paginated list_objects_v2 per group, over the group's
+        common prefix with a '/' delimiter so deeper subdirectories are not
+        paged through, instead of a HEAD request per key. A LIST costs more
+        than a HEAD, so single-key groups, and top-level keys with no common
+        prefix, fall back to get_file_info. Content type and user metadata
+        are not part of the listing, so include_metadata also uses
+        get_file_info for each listed key that exists.
+
+        Args:
+            object_keys: S3 object keys
+            bucket_name: S3 bucket name (uses instance bucket if None)
+            include_metadata: Also fetch content_type and metadata via HEAD
+
+        Returns:
+            Dictionary mapping each key to its metadata, or None if not found
+        """
+        bucket = bucket_name or self.bucket_name
+        if not bucket:
+            logger.error("No bucket name specified")
+            return {}
+
+        wanted = set(object_keys)
+        if not wanted:
+            return {}
+
+        groups: Dict[str, List[str]] = {}
+        for key in wanted:
+            groups.setdefault(key.rpartition('/')[0], []).append(key)
+
+        listed = {}
+        found = {}
+
+        try:
+            paginator = self.s3_client.get_paginator('list_objects_v2')
+            for group in groups.values():
+                prefix = os.path.commonprefix(group)
+                if len(group) == 1 or not prefix:
+                    for key in group:
+                        info = self.get_file_info(key, bucket)
+                        if info is not None:
+                            found[key] = info
+                    continue
+
+                # Listings are returned in key order, so stop once past the group's last key
+                last_key = max(group)
+                # Group keys are all direct children of one directory
+                for page in paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter='/'):
+                    contents = page.get('Contents', ())
+                    for obj in contents:
+                        if obj['Key'] in wanted:
+                            listed[obj['Key']] = {
+                                'key': obj['Key'],
+                                'size': obj['Size'],
+                                'last_modified': obj['LastModified'],
+                                'etag': obj['ETag']
+                            }
+                    if contents and contents[-1]['Key'] >= last_key:
+                        break
+        except ClientError as e:
+            logger.error(f"Failed to list objects in bucket '{bucket}': {e}")
+            return {key: None for key in object_keys}
+
+        if include_metadata:
+            for key in listed:
+                listed[key] = self.get_file_info(key, bucket)
+        found.update(listed)
+
+        return {key: found.get(key) for key in object_keys}
+
     def generate_download_report(self, stats: Dict[str, Any]) -> str:
         """Generate a formatted download report."""
         report = f"""
@@ -318,7 +1073,8 @@ Statistics:
 - Total files processed: {stats.get('total_files', 0)}
 - Successfully downloaded: {stats.get('downloaded', 0)}
 - Failed downloads: {stats.get('failed', 0)}
-- Success rate: {(stats.get('downloaded', 0) / max(stats.get('total_files', 1), 1) * 100):.1f}%
+- Skipped (already up to date): {stats.get('skipped', 0)}
+- Success rate: {((stats.get('downloaded', 0) + stats.get('skipped', 0)) / max(stats.get('total_files', 1), 1) * 100):.1f}%
 
 """
         
@@ -367,6 +1123,8 @@ Examples:
     parser.add_argument('--list-buckets', action='store_true', help='List all accessible buckets')
     parser.add_argument('--list-objects', action='store_true', help='List objects in bucket')
     parser.add_argument('--prefix', default='', help='Object key prefix for filtering')
+    parser.add_argument('--no-recursive', action='store_true',
+                        help='Only list direct children of --prefix')
     
     # Download options
     parser.add_argument('--download-file', help='Download a specific file')
@@ -374,6 +1132,14 @@ Examples:
     parser.add_argument('--local-path', help='Local path for downloaded file')
     parser.add_argument('--extensions', nargs='+', help='File extensions to filter by')
     parser.add_argument('--max-files', type=int, help='Maximum number of files to download')
+    parser.add_argument('--overwrite', action='store_true',
+                        help='Re-download files even if the local copy is up to date')
+    parser.add_argument('--io-uring', action='store_true',
+                        help='Write large files through io_uring (Linux, needs liburing)')
+    parser.add_argument('--no-checksum', action='store_true',
+                        help='Skip S3 checksum (CRC32C/CRC32) validation of downloads')
+    parser.add_argument('--max-workers', type=int, default=DEFAULT_MAX_WORKERS,
+                        help=f'Number of concurrent downloads (default: {DEFAULT_MAX_WORKERS})')
     
     # Output options
     parser.add_argument('--output-dir', help='Download directory (default: ./downloads)')
@@ -386,7 +1152,9 @@ Examples:
         aws_access_key_id=args.access_key,
         aws_secret_access_key=args.secret_key,
         region_name=args.region,
-        bucket_name=args.bucket
+        bucket_name=args.bucket,
+        max_workers=args.max_workers,
+        use_uring=args.io_uring
     )
     
     if args.output_dir:
@@ -394,8 +1162,8 @@ Examples:
         downloader.download_path.mkdir(parents=True, exist_ok=True)
     
     # Suppress progress bars if quiet mode
-    if args.quiet:
-        tqdm.disabled = True
+    downloader.quiet = args.quiet
+    downloader.verify_checksums = not args.no_checksum
     
     try:
         # List buckets
@@ -412,12 +1180,17 @@ Examples:
                 logger.error("Bucket name required for listing objects")
                 return
             
-            objects = downloader.list_objects(args.bucket, args.prefix)
+            objects = downloader.list_objects(
+                args.bucket,
+                args.prefix,
+                recursive=not args.no_recursive,
+                fields=('last_modified',)
+            )
             print(f"\nObjects in bucket '{args.bucket}':")
             for obj in objects:
-                size_mb = obj['size'] / (1024 * 1024)
-                modified = obj['last_modified'].strftime('%Y-%m-%d %H:%M:%S')
-                print(f"  - {obj['key']} ({size_mb:.2f} MB, {modified})")
+                size_mb = obj.size / (1024 * 1024)
+                modified = obj.last_modified.strftime('%Y-%m-%d %H:%M:%S')
+                print(f"  - {obj.key} ({size_mb:.2f} MB, {modified})")
             return
         
         # Download single file
@@ -447,7 +1220,8 @@ Examples:
                 args.download_dir,
                 args.extensions,
                 args.bucket,
-                args.max_files
+                args.max_files,
+                skip_existing=not args.overwrite
             )
             
             # Print report
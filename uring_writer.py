@@ -0,0 +1,169 @@
+"""
+io_uring-backed positional file writer (Linux only)
+
+IoUringWriter moves disk writes off the download threads: callers queue
+(fd, buffer, offset) writes and get a Future back, while a background
+thread batches queued writes into a single io_uring submission.
+
+Requires the optional dependency:
+    pip install liburing
+"""
+
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Dict, List
+
+from liburing import (
+    Cqe,
+    Ring,
+    io_uring_cqe_seen,
+    io_uring_get_sqe,
+    io_uring_prep_write,
+    io_uring_queue_exit,
+    io_uring_queue_init,
+    io_uring_submit,
+    io_uring_wait_cqe,
+)
+
+# Ring size and the most writes handed to the kernel per submission
+DEFAULT_RING_ENTRIES = 64
+DEFAULT_MAX_BATCH = 32
+
+# Writes waiting for the ring before submit() blocks the caller
+DEFAULT_MAX_QUEUED = 64
+
+
+class UringOp:
+    """A single pending write of buf to fd at offset."""
+
+    __slots__ = ('fd', 'buf', 'offset', 'future')
+
+    def __init__(self, fd: int, buf: bytes, offset: int, future: Future):
+        self.fd = fd
+        self.buf = buf
+        self.offset = offset
+        self.future = future
+
+
+class IoUringWriter:
+    """Background io_uring writer; use as a context manager."""
+
+    def __init__(self,
+                 entries: int = DEFAULT_RING_ENTRIES,
+                 max_batch: int = DEFAULT_MAX_BATCH,
+                 max_queued: int = DEFAULT_MAX_QUEUED):
+        """
+        Set up the ring and start the submission thread.
+
+        Args:
+            entries: Submission queue size of the ring
+            max_batch: Maximum writes submitted per io_uring_submit call
+            max_queued: Queued writes before submit() applies backpressure
+        """
+        self._max_batch = max(1, min(max_batch, entries))
+        self._ops: "queue.Queue[UringOp]" = queue.Queue(maxsize=max_queued)
+        self._ring = Ring()
+        io_uring_queue_init(entries, self._ring)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='io-uring-writer', daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "IoUringWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def submit(self, fd: int, buf: bytes, offset: int) -> Future:
+        """
+        Queue a write of buf to fd at offset.
+
+        Returns:
+            Future resolved once the whole buffer has been written
+        """
+        if self._closed:
+            raise RuntimeError("IoUringWriter is closed")
+        future = Future()
+        self._ops.put(UringOp(fd, buf, offset, future))
+        return future
+
+    def close(self) -> None:
+        """Finish queued writes, stop the thread and tear down the ring.
+
+        Call only after every submit() has returned.
+        """
+        if self._thread is None:
+            return
+        self._closed = True
+        self._ops.put(None)
+        self._thread.join()
+        self._thread = None
+        io_uring_queue_exit(self._ring)
+
+    def _run(self) -> None:
+        cqe = Cqe()
+        batch: List[UringOp] = []
+        retries: List[UringOp] = []
+        stopping = False
+        try:
+            while not stopping or retries:
+                # Block for the first write, then batch whatever else is queued
+                batch = retries
+                retries = []
+                if not batch:
+                    op = self._ops.get()
+                    if op is None:
+                        stopping = True
+                        break
+                    batch.append(op)
+                while len(batch) < self._max_batch and not stopping:
+                    try:
+                        op = self._ops.get_nowait()
+                    except queue.Empty:
+                        break
+                    if op is None:
+                        stopping = True
+                    else:
+                        batch.append(op)
+
+                in_flight: Dict[int, UringOp] = {}
+                for index, op in enumerate(batch):
+                    sqe = io_uring_get_sqe(self._ring)
+                    io_uring_prep_write(sqe, op.fd, op.buf, op.offset)
+                    sqe.user_data = index
+                    in_flight[index] = op
+                io_uring_submit(self._ring)
+
+                for _ in range(len(in_flight)):
+                    io_uring_wait_cqe(self._ring, cqe)
+                    entry = cqe[0]
+                    op = in_flight.pop(entry.user_data)
+                    try:
+                        # Negative results surface here as OSError
+                        written = entry.res
+                    except OSError as e:
+                        op.future.set_exception(e)
+                        continue
+                    finally:
+                        io_uring_cqe_seen(self._ring, entry)
+                    if written < len(op.buf):
+                        # Short write: resubmit the remainder in the next batch
+                        retries.append(UringOp(op.fd, op.buf[written:], op.offset + written,
+                                               op.future))
+                    else:
+                        op.future.set_result(None)
+        except Exception as e:
+            # A ring failure (e.g. EINTR from submit or wait) must not strand
+            # callers blocked on their futures: reject new writes, fail every
+            # write in flight, then keep failing queued ones until close()
+            self._closed = True
+            for op in batch + retries:
+                if not op.future.done():
+                    op.future.set_exception(e)
+            while not stopping:
+                op = self._ops.get()
+                if op is None:
+                    stopping = True
+                else:
+                    op.future.set_exception(e)